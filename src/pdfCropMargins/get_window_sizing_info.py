@@ -13,6 +13,7 @@ to open a test window, zoom it, get window the sizing info, and destroy it.
 import sys
 import tkinter as tk
 import warnings
+import functools
 from pdfCropMargins.vendor.pysimplegui_4_foss import PySimpleGUI as sg
 from . import external_program_calls as ex
 
@@ -63,10 +64,12 @@ def get_usable_image_size(args, window, full_window_width, full_window_height,
                                          usable_height - non_im_height - top_pixels)
     return (usable_im_width, usable_im_height), (non_im_width, non_im_height)
 
+@functools.lru_cache(maxsize=None)
 def get_window_size(scaling):
     """Get physical screen dimension to determine the page image max size.  Some
     extra space is reserved for titlebars/borders or other unaccounted-for space
-    in the windows."""
+    in the windows.  The screen size is assumed fixed for the process, so the
+    result is cached to avoid creating and destroying test windows again."""
     os = ex.system_os
     if os == "Linuxx" or "Darwin": # Darwin not tested...
         width, height = get_window_size_tk(scaling)
@@ -42,11 +42,14 @@ import time
 import threading
 import math
 import io
+import functools
+from collections import OrderedDict
 from types import SimpleNamespace
 from PIL import Image
 
 from . import external_program_calls as ex
-from .pymupdf_routines import has_mupdf, MuPdfDocument
+from .pymupdf_routines import (has_mupdf, MuPdfDocument, get_display_page_key,
+                               shrink_mupdf_store)
 
 if not has_mupdf:
     print("\nError in pdfCropMargins: The GUI feature requires a recent PyMuPDF version."
@@ -99,48 +102,62 @@ def call_all_update_funs(update_funs, values_dict):
     for f in update_funs:
         f(values_dict)
 
+NA = "N/A" # The text shown for a single value when the four values differ.
+BOOL_STRINGS = {"True": True, "False": False}
+QUAD_INDICES = (0, 1, 2, 3) # The indices of the values of the four-value options.
+BOUNDING_BOX_CACHE_SIZE = 8 # The number of bounding box lists saved for reuse by later crops.
+
 def to_float_or_NA(value):
     """Convert to float unless the value is 'N/A', which is left unchanged."""
-    if value == "N/A":
-        return "N/A"
-    else:
-        return float(value)
+    return value if value == NA else float(value)
 
 def to_int_or_NA(value):
-    """Convert to float unless the value is 'N/A', which is left unchanged."""
-    if value == "N/A":
-        return "N/A"
-    else:
-        return int(value)
+    """Convert to int unless the value is 'N/A', which is left unchanged."""
+    return value if value == NA else int(value)
 
 def str_to_bool(string):
     """Convert a string "True" or "False" to the boolean True or False, respectively."""
-    if string == "True":
-        return True
-    elif string == "False":
-        return False
-    else:
+    try:
+        return BOOL_STRINGS[string]
+    except KeyError:
         print("Error in pdfCropMargins: String cannot be converted to bool.",
               file=sys.stderr)
         ex.cleanup_and_exit(1)
 
+def get_element_value(element, values_dict):
+    """Return the value of `element` from the `values_dict` returned by the
+    window's `Read`, which avoids querying tkinter.  If `values_dict` is `None`
+    the value is read from the element itself."""
+    if values_dict is None:
+        return element.Get()
+    return values_dict[element.Key]
+
+def all_equal4(values4):
+    """Return true if the four values in `values4` are all equal."""
+    left, bottom, right, top = values4
+    return left == bottom == right == top
+
 def update_value_and_return_it(input_text_element, value=None, fun_to_apply=None,
-                               max_val=None, min_val=None):
+                               max_val=None, min_val=None, values_dict=None):
     """
     1) Get the text in the `InputText` element `input_text_element`.
     2) Apply the function `fun_to_apply` to it (if one is passed in).
     3) Update the text back to the new value.
 
-    If `value` is passed in it will be used in place of the text from step 1)."""
+    If `value` is passed in it will be used in place of the text from step 1).
+    The element is not updated if it already shows the text of the new value.
+    The text is taken from `values_dict` when it is passed in."""
+    element_text = get_element_value(input_text_element, values_dict)
     if value is None:
-        value = input_text_element.Get()
+        value = element_text
     if fun_to_apply:
         value = fun_to_apply(value)
     if max_val is not None and not isinstance(value, str):
         value = min(value, max_val)
     if min_val is not None and not isinstance(value, str):
         value = max(value, min_val)
-    input_text_element.Update(value)
+    if str(value) != str(element_text): # A `Spin` element can return an int.
+        input_text_element.Update(value)
     return value
 
 def update_combo_box(values_dict, element, element_key, args, attr, fun_to_apply):
@@ -165,28 +182,21 @@ def update_checkbox(values_dict, element, element_key, args, attr, fun_to_apply=
 
 def update_4_values(element_list, attr, args_dict, values_dict, value_type=float,
                     max_val=None, min_val=None):
-    """Update four values from a 4-value argument to argparse."""
+    """Update four values from a 4-value argument to argparse.  The element
+    texts are converted in one pass, and each element is then updated once
+    (which also converts forms like 5 to 5.0)."""
     args_attr = args_dict[attr]
 
-    def update_all_from_args_dict():
-        for i in [0,1,2,3]:
-            update_value_and_return_it(element_list[i], value=args_attr[i],
-                                       max_val=max_val, min_val=min_val)
-
     try:
-        # This comprehension is just to test that the format is correct and casts work.
-        element_text4 = [str(value_type(element_list[i].Get())) for i in [0,1,2,3]]
+        values4 = [value_type(get_element_value(element, values_dict))
+                   for element in element_list]
     except ValueError:
-        update_all_from_args_dict() # Replace bad text with saved version.
-        return
+        values4 = args_attr # Replace bad text with saved version.
 
-    for i in [0,1,2,3]:
-        args_attr[i] = update_value_and_return_it(element_list[i],
-                                                  fun_to_apply=value_type,
-                                                  max_val=max_val, min_val=min_val)
-
-    # Update all, to convert forms like 5 to 5.0 (which were equal above).
-    update_all_from_args_dict()
+    args_attr[:] = [update_value_and_return_it(element, value=value,
+                                               max_val=max_val, min_val=min_val,
+                                               values_dict=values_dict)
+                    for element, value in zip(element_list, values4)]
 
 def update_paired_1_and_4_values(element, element_list4, attr, attr4, args_dict,
                                  values_dict, value_type=to_float_or_NA,
@@ -199,50 +209,71 @@ def update_paired_1_and_4_values(element, element_list4, attr, attr4, args_dict,
 
     def update_all_from_args_dict():
         update_value_and_return_it(element, value=args_attr[0],
-                                   max_val=max_val, min_val=min_val)
-        for i in [0,1,2,3]:
-            update_value_and_return_it(element_list4[i], value=args_attr4[i],
-                                       max_val=max_val, min_val=min_val)
+                                   max_val=max_val, min_val=min_val,
+                                   values_dict=values_dict)
+        for element4, value4 in zip(element_list4, args_attr4):
+            update_value_and_return_it(element4, value=value4,
+                                       max_val=max_val, min_val=min_val,
+                                       values_dict=values_dict)
 
     try:
-        element_text = str(value_type(element.Get()))
-        #element_text = str(value_type(values_dict[attr])) # Also works.
-        element_text4 = [str(value_type4(element_list4[i].Get())) for i in [0,1,2,3]]
+        element_value = value_type(get_element_value(element, values_dict))
+        element_values4 = [value_type4(get_element_value(element4, values_dict))
+                           for element4 in element_list4]
     except ValueError:
         update_all_from_args_dict() # Replace bad text with saved version.
         return
     # See if the element value changed.
-    if value_type(element_text) != args_attr[0] and element_text != "N/A":
+    if element_value != args_attr[0] and element_value != NA:
         args_attr[0] = update_value_and_return_it(element, fun_to_apply=value_type,
-                                                  max_val=max_val, min_val=min_val)
-        for i in [0,1,2,3]:
-            args_attr4[i] = update_value_and_return_it(element_list4[i],
-                                                       value=args_attr[0],
-                                                       max_val=max_val, min_val=min_val)
+                                                  max_val=max_val, min_val=min_val,
+                                                  values_dict=values_dict)
+        for i, element4 in enumerate(element_list4):
+            args_attr4[i] = update_value_and_return_it(element4, value=args_attr[0],
+                                                       max_val=max_val, min_val=min_val,
+                                                       values_dict=values_dict)
 
     # See if any of the element_list4 values changed.
-    elif any(value_type4(element_text4[i]) != args_attr4[i] for i in [0,1,2,3]):
-        for i in [0,1,2,3]:
-            args_attr4[i] = update_value_and_return_it(element_list4[i],
-                                                       fun_to_apply=value_type4,
-                                                       max_val=max_val, min_val=min_val)
-        if len(set(args_attr4)) == 1: # All are the same value.
+    elif element_values4 != list(args_attr4):
+        for i, element4 in enumerate(element_list4):
+            args_attr4[i] = update_value_and_return_it(element4, fun_to_apply=value_type4,
+                                                       max_val=max_val, min_val=min_val,
+                                                       values_dict=values_dict)
+        if all_equal4(args_attr4): # All are the same value.
             args_attr[0] = update_value_and_return_it(element, value=args_attr4[0],
-                                                      max_val=max_val, min_val=min_val)
+                                                      max_val=max_val, min_val=min_val,
+                                                      values_dict=values_dict)
         else:
-            args_attr[0] = update_value_and_return_it(element, value="N/A")
+            args_attr[0] = update_value_and_return_it(element, value=NA, values_dict=values_dict)
 
-    # Update all, to convert forms like 5 to 5.0 (which were equal above).
-    update_all_from_args_dict()
+    # Nothing changed, but update all to convert forms like 5 to 5.0 (which were
+    # equal above).  The branches above already leave every element synchronized.
+    else:
+        update_all_from_args_dict()
+
+def update_paired_args(element, element_list4, attr, attr4, args, args_dict,
+                       values_dict):
+    """Update a pair of float options like `percentRetain` and `percentRetain4`
+    and copy the backing values in `args_dict` to the actual `args` object.
+    Partial applications of this are used as update functions in the GUI."""
+    update_paired_1_and_4_values(element, element_list4, attr, attr4, args_dict,
+                                 values_dict)
+    setattr(args, attr, args_dict[attr])
+    setattr(args, attr4, args_dict[attr4])
 
 ##
 ## Define the buttons/events we want to handle in the event loop.
 ##
 
+CROP_DONE_EVENT = "-CROP-DONE-" # Event sent by the crop thread when it finishes.
+
 class Events(SimpleNamespace):
     """The events to handle in the event loop.  The class is just used as a
     namespace for holding the event tests."""
     # When no longer supporting Python2 consider making this a SimpleNamespace instance.
+    def is_crop_done(btn):
+        return btn == CROP_DONE_EVENT
+
     def is_enter(btn):
         return btn.startswith("Return:") or btn == chr(13)
 
@@ -311,6 +342,54 @@ class Events(SimpleNamespace):
     def is_configure(btn):
         return btn.startswith("Configure")
 
+# The kinds of events, paired with their tests, in the order they are checked.
+EVENT_KIND_TESTS = (
+        ("crop_done", Events.is_crop_done),
+        ("exit", Events.is_exit),
+        ("enter", Events.is_enter),
+        ("page_num_change", Events.is_page_num_change),
+        ("next", Events.is_next),
+        ("prev", Events.is_prev),
+        ("up", Events.is_up),
+        ("down", Events.is_down),
+        ("home", Events.is_home),
+        ("end", Events.is_end),
+        ("left", Events.is_left),
+        ("right", Events.is_right),
+        ("zoom", Events.is_zoom),
+        ("crop", Events.is_crop),
+        ("original", Events.is_original),
+        ("left_smallest_delta", Events.is_left_smallest_delta),
+        ("top_smallest_delta", Events.is_top_smallest_delta),
+        ("bottom_smallest_delta", Events.is_bottom_smallest_delta),
+        ("right_smallest_delta", Events.is_right_smallest_delta),
+        ("paired_single_and_quadruple_change", Events.is_paired_single_and_quadruple_change),
+        ("evenodd", Events.is_evenodd),
+        ("general_checkbox_click", Events.is_general_checkbox_click),
+        ("configure", Events.is_configure),
+        )
+
+# The kinds of events which only update the values of the options.
+VALUE_CHANGE_EVENT_KINDS = frozenset({"paired_single_and_quadruple_change", "evenodd",
+                                      "general_checkbox_click"})
+
+@functools.lru_cache(maxsize=256)
+def get_event_kind(event):
+    """Return the kind of the event `event` from `EVENT_KIND_TESTS`, or `None` if
+    it is not one of those events.  The same event strings are returned over and
+    over by the event loop, so the results are cached to avoid rerunning the tests."""
+    if not isinstance(event, str):
+        return None
+    for kind, event_test in EVENT_KIND_TESTS:
+        if event_test(event):
+            return kind
+    return None
+
+# Static help texts shown in the window layout.
+ZOOM_HELP_TEXT = "(arrow keys navigate while zooming)"
+QUADRUPLES_HELP_TEXT = ("Quadruples are left, top, bottom, and right margins.\n"
+                        "Mouse left over option names to show descriptions.")
+
 #
 # The main function with the event loop.
 #
@@ -333,9 +412,17 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
 
     document_pages = MuPdfDocument(args)
     num_pages = document_pages.open_document(fixed_input_doc_fname)
+    all_page_nums = frozenset(range(num_pages)) # For checking page range specifiers.
     curr_page = 0
 
     sg.SetOptions(tooltip_time=500)
+
+    def option_text(option_string, **kwargs):
+        """Return a `Text` element labeling the option `option_string`, with the
+        option's help text as its tooltip."""
+        return sg.Text(option_string, **kwargs,
+                       tooltip=get_help_text_string_for_tooltip(cmd_parser, option_string))
+
     window_title = f"pdfCropMargins: {os.path.basename(input_doc_fname)}"
 
     ##
@@ -363,75 +450,59 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
                                   size=(5, 1), enable_events=True, key="PageNumber")
     text_page_num = sg.Text("Page:")
 
-    def update_page_number(curr_page, prev_curr_page, num_pages, btn, value,
-                           input_text_element):
-        curr_page = max(curr_page, 0)
-        curr_page = min(curr_page, num_pages-1)
-        # Update page number field.
-        input_text_element.Update(str(curr_page + 1))
+    def update_page_number(curr_page, num_pages, value, input_text_element):
+        """Clamp `curr_page` to the document and show it in the page number
+        field, unless the field's current `value` already shows it.  The spinner
+        returns ints for values in its list, so `value` is compared as a string."""
+        curr_page = min(max(curr_page, 0), num_pages-1)
+        page_num_string = str(curr_page + 1)
+        if str(value) != page_num_string:
+            input_text_element.Update(page_num_string)
         return curr_page
 
+    def get_entered_page(values_dict, prev_curr_page):
+        """Return the 0-based page number from the page number field, or
+        `prev_curr_page` if the field does not hold an integer."""
+        try:
+            return int(values_dict["PageNumber"]) - 1
+        except (ValueError, TypeError): # Non-integer text, or `None`.
+            return prev_curr_page
+
+    def make_paired_float_elements(attr):
+        """Create the text and input elements for the float option `attr` and
+        its four-value version `attr + "4"`, and register their update function.
+        Returns the tuple `(text, input_text, text4, input_text4_list)`."""
+        attr4 = attr + "4"
+        args_dict[attr] = getattr(args, attr)
+        args_dict[attr4] = getattr(args, attr4)
+        if not all_equal4(args_dict[attr4]): # Set initial value if all the same.
+            args_dict[attr] = [NA]
+
+        text = option_text(attr)
+        input_text = sg.InputText(args_dict[attr][0], pad=(0,0),
+                                  size=(5, 1), do_not_clear=True, key=attr)
+        text4 = option_text(attr4)
+        input_text4 = [sg.InputText(args_dict[attr4][i], size=(5, 1),
+                                    do_not_clear=True, key=f"{attr4}_{i}", pad=(1,0))
+                       for i in QUAD_INDICES]
+
+        update_funs.append(functools.partial(update_paired_args, input_text,
+                           input_text4, attr, attr4, args, args_dict))
+        return text, input_text, text4, input_text4
+
     ##
     ## Code for percentRetain options.
     ##
 
-    args_dict["percentRetain"] = args.percentRetain
-    if len(set(args.percentRetain4)) != 1: # Set initial value if all the same.
-        args_dict["percentRetain"] = ["N/A"]
-    text_percentRetain = sg.Text("percentRetain",
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "percentRetain"))
-    input_text_percentRetain = sg.InputText(args_dict["percentRetain"][0], pad=(0,0),
-                                 size=(5, 1), do_not_clear=True, key="percentRetain")
-
-    # Code for percentRetain4.
-    args_dict["percentRetain4"] = args.percentRetain4
-    text_percentRetain4 = sg.Text("percentRetain4",
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "percentRetain4"))
-    input_text_percentRetain4 = [sg.InputText(args_dict["percentRetain4"][i], size=(5, 1),
-                                 do_not_clear=True, key=f"percentRetain4_{i}", pad=(1,0))
-                                 for i in [0,1,2,3]]
-
-    def update_percentRetain_values(values_dict):
-        """Update both the percentRetain value and the percentRetain4 values."""
-        update_paired_1_and_4_values(input_text_percentRetain,
-                    input_text_percentRetain4, "percentRetain", "percentRetain4",
-                    args_dict, values_dict)
-        # Copy backing values to the actual args object.
-        args.percentRetain = args_dict["percentRetain"]
-        args.percentRetain4 = args_dict["percentRetain4"]
-
-    update_funs.append(update_percentRetain_values)
+    (text_percentRetain, input_text_percentRetain, text_percentRetain4,
+     input_text_percentRetain4) = make_paired_float_elements("percentRetain")
 
     ##
     ## Code for absoluteOffset options.
     ##
 
-    args_dict["absoluteOffset"] = args.absoluteOffset
-    if len(set(args.absoluteOffset4)) != 1: # Set initial value if all the same.
-        args_dict["absoluteOffset"] = ["N/A"]
-    text_absoluteOffset = sg.Text("absoluteOffset",
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "absoluteOffset"))
-    input_text_absoluteOffset = sg.InputText(args_dict["absoluteOffset"][0], pad=(0,0),
-                                 size=(5, 1), do_not_clear=True, key="absoluteOffset")
-
-    # Code for absoluteOffset4.
-    args_dict["absoluteOffset4"] = args.absoluteOffset4
-    text_absoluteOffset4 = sg.Text("absoluteOffset4",
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "absoluteOffset4"))
-    input_text_absoluteOffset4 = [sg.InputText(args_dict["absoluteOffset4"][i], size=(5, 1),
-                                 do_not_clear=True, key=f"absoluteOffset4_{i}", pad=(1,0))
-                                 for i in [0,1,2,3]]
-
-    def update_absoluteOffset_values(values_dict):
-        """Update both the absoluteOffset value and the absoluteOffset4 values."""
-        update_paired_1_and_4_values(input_text_absoluteOffset,
-                    input_text_absoluteOffset4, "absoluteOffset", "absoluteOffset4",
-                    args_dict, values_dict)
-        # Copy backing values to the actual args object.
-        args.absoluteOffset = args_dict["absoluteOffset"]
-        args.absoluteOffset4 = args_dict["absoluteOffset4"]
-
-    update_funs.append(update_absoluteOffset_values)
+    (text_absoluteOffset, input_text_absoluteOffset, text_absoluteOffset4,
+     input_text_absoluteOffset4) = make_paired_float_elements("absoluteOffset")
 
     ##
     ## Code for uniformOrderStat options.
@@ -445,7 +516,7 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
 
     if args.uniformOrderStat4:
         args_dict["uniformOrderStat4"] = args.uniformOrderStat4
-        if len(set(args.uniformOrderStat4)) != 1: # Set initial value if all the same.
+        if not all_equal4(args.uniformOrderStat4): # Set initial value if all the same.
             args_dict["uniformOrderStat"] = [0]
         else:
             args_dict["uniformOrderStat"] = [args.uniformOrderStat4[0]]
@@ -456,19 +527,17 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
 
     dummy_spacing_spinner = sg.Text("", size=(7,1), pad=(0,0))
 
-    text_uniformOrderStat = sg.Text("uniformOrderStat",
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "uniformOrderStat"))
+    text_uniformOrderStat = option_text("uniformOrderStat")
     input_text_uniformOrderStat = sg.Spin(values=uniformOrderStat_spinner_values,
                                  initial_value=args_dict["uniformOrderStat"][0], pad=(0,0),
                                  size=(5, 1), enable_events=True, key="uniformOrderStat")
 
     # Code for uniformOrderStat4.
-    text_uniformOrderStat4 = sg.Text("uniformOrderStat4",
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "uniformOrderStat4"))
+    text_uniformOrderStat4 = option_text("uniformOrderStat4")
     input_text_uniformOrderStat4 = [sg.Spin(values=uniformOrderStat_spinner_values,
                                     initial_value=args_dict["uniformOrderStat4"][i], size=(5, 1),
                                     enable_events=True, key=f"uniformOrderStat4_{i}", pad=(1,0))
-                                    for i in [0,1,2,3]]
+                                    for i in QUAD_INDICES]
 
     def update_uniformOrderStat_values(values_dict):
         """Update both the uniformOrderStat value and the uniformOrderStat4 values."""
@@ -478,7 +547,7 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
               value_type=to_int_or_NA, value_type4=int, max_val=num_pages-1, min_val=0)
         # Copy backing values to the actual args object.
         args.uniformOrderStat = [] # Not needed with uniformOrderStat4 always set.
-        if all(i == 0 for i in args_dict["uniformOrderStat4"]):
+        if not any(args_dict["uniformOrderStat4"]): # All four are zero.
             args.uniformOrderStat4 = [] # Need to empty it, since it implies uniform option.
         else:
             args.uniformOrderStat4 = args_dict["uniformOrderStat4"]
@@ -494,11 +563,8 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
                                         "uniform"),
                                     enable_events=True, default=args.uniform)
 
-    def update_uniform(values_dict):
-        """Update the uniform values."""
-        update_checkbox(values_dict, checkbox_uniform, "uniform", args, "uniform")
-
-    update_funs.append(update_uniform)
+    update_funs.append(functools.partial(update_checkbox, element=checkbox_uniform,
+                       element_key="uniform", args=args, attr="uniform"))
 
     ##
     ## Code for samePageSize.
@@ -510,12 +576,8 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
                                              cmd_parser, "samePageSize"),
                                          default=args.samePageSize)
 
-    def update_samePageSize(values_dict):
-        """Update the samePageSize values."""
-        update_checkbox(values_dict, checkbox_samePageSize, "samePageSize", args,
-                         "samePageSize")
-
-    update_funs.append(update_samePageSize)
+    update_funs.append(functools.partial(update_checkbox, element=checkbox_samePageSize,
+                       element_key="samePageSize", args=args, attr="samePageSize"))
 
     ##
     ## Code for evenodd option.
@@ -527,11 +589,8 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
                                         cmd_parser, "evenodd"),
                                     default=args.evenodd)
 
-    def update_evenodd(values_dict):
-        """Update the evenodd values."""
-        update_checkbox(values_dict, checkbox_evenodd, "evenodd", args, "evenodd")
-
-    update_funs.append(update_evenodd)
+    update_funs.append(functools.partial(update_checkbox, element=checkbox_evenodd,
+                       element_key="evenodd", args=args, attr="evenodd"))
 
     ##
     ## Code for percentText.
@@ -542,11 +601,8 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
                                         "percentText"),
                                     enable_events=True, default=args.percentText)
 
-    def update_percentText(values_dict):
-        """Update the percentText values."""
-        update_checkbox(values_dict, checkbox_percentText, "percentText", args, "percentText")
-
-    update_funs.append(update_percentText)
+    update_funs.append(functools.partial(update_checkbox, element=checkbox_percentText,
+                       element_key="percentText", args=args, attr="percentText"))
 
     ##
     ## Code for cropSafe.
@@ -557,11 +613,8 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
                                         "cropSafe"),
                                     enable_events=True, default=args.cropSafe)
 
-    def update_cropSafe(values_dict):
-        """Update the cropSafe values."""
-        update_checkbox(values_dict, checkbox_cropSafe, "cropSafe", args, "cropSafe")
-
-    update_funs.append(update_cropSafe)
+    update_funs.append(functools.partial(update_checkbox, element=checkbox_cropSafe,
+                       element_key="cropSafe", args=args, attr="cropSafe"))
 
 
     ##
@@ -569,17 +622,20 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
     ##
 
     args_dict["pages"] = args.pages if args.pages else ""
-    text_pages = sg.Text("pages", pad=((0,22), None),
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "pages"))
+    text_pages = option_text("pages", pad=((0,22), None))
     input_text_pages = sg.InputText(args_dict["pages"],
                                  size=(7, 1), do_not_clear=True, key="pages")
 
+    last_valid_pages_value = "" # The last pages value that parsed without error.
+
     def update_pages_values(values_dict):
         """Update the pages value."""
+        nonlocal last_valid_pages_value
         value = values_dict["pages"]
         try:
-            if value: # Parse here only to test for errors.
-                parse_page_range_specifiers(value, set(range(num_pages)))
+            if value and value != last_valid_pages_value: # Parse only to test for errors.
+                parse_page_range_specifiers(value, all_page_nums)
+                last_valid_pages_value = value
         except ValueError:
             sg.PopupError(f"Bad page specifier '{value}'.")
             input_text_pages.Update("")
@@ -595,27 +651,22 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
     ## Code for restore.
     ##
 
-    text_restore = sg.Text("restore", pad=(0,0),
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "restore"))
+    text_restore = option_text("restore", pad=(0,0))
 
     combo_box_restore = sg.Combo(["True", "False"], readonly=True,
                                  default_value=str(args.restore), size=(5, 1),
                                  key="restore", enable_events=True)
 
-    def update_restore(values_dict):
-        """Update the restore values."""
-        update_combo_box(values_dict, combo_box_restore, "restore", args, "restore",
-                        fun_to_apply=str_to_bool)
-
-    update_funs.append(update_restore)
+    update_funs.append(functools.partial(update_combo_box, element=combo_box_restore,
+                       element_key="restore", args=args, attr="restore",
+                       fun_to_apply=str_to_bool))
 
     ##
     ## Code for setPageRatios option.
     ##
 
     args_dict["setPageRatios"] = args.setPageRatios if args.setPageRatios else ""
-    text_setPageRatios = sg.Text("setPageRatios", pad=((0,25), None),
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "setPageRatios"))
+    text_setPageRatios = option_text("setPageRatios", pad=((0,25), None))
     input_text_setPageRatios = sg.InputText(args_dict["setPageRatios"], pad=(0,0),
                                  size=(7, 1), do_not_clear=True, key="setPageRatios")
 
@@ -623,19 +674,16 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
         """Update the setPageRatios value."""
         value = values_dict["setPageRatios"]
         try:
-            if value:
-                parse_page_ratio_argument(value)
+            page_ratios = parse_page_ratio_argument(value) if value else None
         except ValueError:
             sg.PopupError("Bad page ratio specifier.")
             input_text_setPageRatios.Update("")
             args_dict["setPageRatios"] = ""
+            page_ratios = None
         else:
-            args_dict["setPageRatios"] = values_dict["setPageRatios"]
+            args_dict["setPageRatios"] = value
         # Copy backing value to the actual args object.
-        if args_dict["setPageRatios"]:
-            args.setPageRatios = parse_page_ratio_argument(args_dict["setPageRatios"])
-        else:
-            args.setPageRatios = None
+        args.setPageRatios = page_ratios
 
     update_funs.append(update_setPageRatios_values)
 
@@ -644,11 +692,10 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
     ##
 
     args_dict["pageRatioWeights"] = args.pageRatioWeights
-    text_pageRatioWeights = sg.Text("pageRatioWeights",
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "pageRatioWeights"))
+    text_pageRatioWeights = option_text("pageRatioWeights")
     input_text_pageRatioWeights = [sg.InputText(args_dict["pageRatioWeights"][i], size=(5, 1),
                                  do_not_clear=True, key=f"pageRatioWeights_{i}", pad=(1,0))
-                                 for i in [0,1,2,3]]
+                                 for i in QUAD_INDICES]
 
     def update_pageRatioWeights_values(values_dict):
         """Update both the pageRatioWeights value and the pageRatioWeights values."""
@@ -663,40 +710,15 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
     ## Code for absolutePreCrop options.
     ##
 
-    args_dict["absolutePreCrop"] = args.absolutePreCrop
-    if len(set(args.absolutePreCrop4)) != 1: # Set initial value if all the same.
-        args_dict["absolutePreCrop"] = ["N/A"]
-    text_absolutePreCrop = sg.Text("absolutePreCrop",
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "absolutePreCrop"))
-    input_text_absolutePreCrop = sg.InputText(args_dict["absolutePreCrop"][0], pad=(0,0),
-                                 size=(5, 1), do_not_clear=True, key="absolutePreCrop")
-
-    # Code for absolutePreCrop4.
-    args_dict["absolutePreCrop4"] = args.absolutePreCrop4
-    text_absolutePreCrop4 = sg.Text("absolutePreCrop4",
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "absolutePreCrop4"))
-    input_text_absolutePreCrop4 = [sg.InputText(args_dict["absolutePreCrop4"][i], size=(5, 1),
-                                 do_not_clear=True, key=f"absolutePreCrop4_{i}", pad=(1,0))
-                                 for i in [0,1,2,3]]
-
-    def update_absolutePreCrop_values(values_dict):
-        """Update both the absolutePreCrop value and the absolutePreCrop4 values."""
-        update_paired_1_and_4_values(input_text_absolutePreCrop,
-                    input_text_absolutePreCrop4, "absolutePreCrop", "absolutePreCrop4",
-                    args_dict, values_dict)
-        # Copy backing values to the actual args object.
-        args.absolutePreCrop = args_dict["absolutePreCrop"]
-        args.absolutePreCrop4 = args_dict["absolutePreCrop4"]
-
-    update_funs.append(update_absolutePreCrop_values)
+    (text_absolutePreCrop, input_text_absolutePreCrop, text_absolutePreCrop4,
+     input_text_absolutePreCrop4) = make_paired_float_elements("absolutePreCrop")
 
     ##
     ## Code for threshold option.
     ##
 
     args_dict["threshold"] = int(args.threshold[0]) if args.calcbb != "gb" else "----"
-    text_threshold = sg.Text("threshold", pad=((0,0), None),
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "threshold"))
+    text_threshold = option_text("threshold", pad=((0,0), None))
     input_num_threshold = sg.Spin(values=tuple(range(256)),
                                   initial_value=args_dict["threshold"],
                                   size=(3, 1), key="threshold")
@@ -704,7 +726,8 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
     def update_threshold_values(values_dict):
         """Update the threshold value."""
         if args.calcbb == "gb":
-            input_num_threshold.Update("----")
+            if values_dict["threshold"] != "----": # Only reset text if it was changed.
+                input_num_threshold.Update("----")
             return
         try:
             value = int(values_dict["threshold"])
@@ -723,8 +746,7 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
     ##
 
     args_dict["numBlurs"] = int(args.numBlurs) if args.calcbb != "gb" else "--"
-    text_numBlurs = sg.Text("numBlurs", pad=((0,0), None),
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "numBlurs"))
+    text_numBlurs = option_text("numBlurs", pad=((0,0), None))
     input_num_numBlurs = sg.Spin(values=spinner_values,
                                  initial_value=args_dict["numBlurs"],
                                  size=(2, 1), key="numBlurs")
@@ -732,7 +754,8 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
     def update_numBlurs_values(values_dict):
         """Update the numBlurs value."""
         if args.calcbb == "gb":
-            input_num_numBlurs.Update("--")
+            if values_dict["numBlurs"] != "--": # Only reset text if it was changed.
+                input_num_numBlurs.Update("--")
             return
         try:
             value = int(values_dict["numBlurs"])
@@ -751,8 +774,7 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
     ##
 
     args_dict["numSmooths"] = int(args.numSmooths) if args.calcbb != "gb" else "--"
-    text_numSmooths = sg.Text("numSmooths", pad=((0,0), None),
-                      tooltip=get_help_text_string_for_tooltip(cmd_parser, "numSmooths"))
+    text_numSmooths = option_text("numSmooths", pad=((0,0), None))
     input_num_numSmooths = sg.Spin(values=spinner_values,
                                    initial_value=args_dict["numSmooths"],
                                    size=(2, 1), key="numSmooths")
@@ -760,7 +782,8 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
     def update_numSmooths_values(values_dict):
         """Update the numSmooths value."""
         if args.calcbb == "gb":
-            input_num_numSmooths.Update("--")
+            if values_dict["numSmooths"] != "--": # Only reset text if it was changed.
+                input_num_numSmooths.Update("--")
             return
         try:
             value = int(values_dict["numSmooths"])
@@ -812,22 +835,34 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
                                      sg.Column([[smallest_delta_right]], pad=(0,0)), # Extraneous col.
                                     ]
 
+    displayed_delta_values = None # The delta values and disabled state currently shown.
+
     def update_smallest_delta_values_display(delta_page_nums, disabled=False):
+        nonlocal displayed_delta_values
+        if displayed_delta_values == (tuple(delta_page_nums), disabled):
+            return # Already displayed, e.g. when recropping gives the same deltas.
+        displayed_delta_values = (tuple(delta_page_nums), disabled)
+
         smallest_delta_label_text.Update("Minimum cropping delta pages:")
-        num_strings = [f"{i}" for i in delta_page_nums]
+        num_strings = [str(i) for i in delta_page_nums]
         max_len = max(len(i) for i in num_strings)
-        num_strings = [" "*(max_len-len(i)) + i for i in num_strings] # Right-align.
-        smallest_delta_left.Update(num_strings[0], visible=True, disabled=disabled)
-        smallest_delta_top.Update(num_strings[3], visible=True, disabled=disabled)
-        smallest_delta_bottom.Update(num_strings[1], visible=True, disabled=disabled)
-        smallest_delta_right.Update(num_strings[2], visible=True, disabled=disabled)
+        left, bottom, right, top = (i.rjust(max_len) for i in num_strings) # Right-align.
+        # Setting visibility repacks the widgets, so only do it when they are hidden.
+        visible = None if smallest_delta_left.visible else True
+        smallest_delta_left.Update(left, visible=visible, disabled=disabled)
+        smallest_delta_top.Update(top, visible=visible, disabled=disabled)
+        smallest_delta_bottom.Update(bottom, visible=visible, disabled=disabled)
+        smallest_delta_right.Update(right, visible=visible, disabled=disabled)
 
     def set_delta_values_null():
+        nonlocal displayed_delta_values
+        displayed_delta_values = None
         smallest_delta_label_text.Update("")
-        smallest_delta_left.Update("", visible=False, disabled=True)
-        smallest_delta_top.Update("", visible=False, disabled=True)
-        smallest_delta_bottom.Update("", visible=False, disabled=True)
-        smallest_delta_right.Update("", visible=False, disabled=True)
+        visible = False if smallest_delta_left.visible else None
+        smallest_delta_left.Update("", visible=visible, disabled=True)
+        smallest_delta_top.Update("", visible=visible, disabled=True)
+        smallest_delta_bottom.Update("", visible=visible, disabled=True)
+        smallest_delta_right.Update("", visible=visible, disabled=True)
 
     def get_page_from_delta_page_nums(delta_page_nums, toggle, delta_index):
         if isinstance(delta_page_nums[delta_index], tuple):
@@ -850,20 +885,77 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
                           max(window.size[1]-non_image_size[1], FALLBACK_MAX_IMAGE_SIZE[1]))
         return max_image_size
 
+    last_page_image = None # The (render_key, page_image_data) of the displayed image.
+
     def update_page_image(window, reset_cached=False, zoom=False, max_image_size=None,
                           update_image_element=True):
         """Calculate and return data for the image in the PDF preview.  If
         `max_image_size` is not passed in (the default) it will be calculated.
         If `update_image_element` is true (the default) then the GUI image is
-        updated with the newly calculated image data."""
+        updated with the newly calculated image data.  If the page, zoom, and
+        image size are the same as for the currently-displayed image then the
+        saved data is returned without re-rendering (unless `reset_cached` is
+        true)."""
+        nonlocal last_page_image
         if max_image_size is None:
             max_image_size = get_max_image_size(window)
-        image_data, clip_pos, im_ht, im_wid = document_pages.get_display_page(curr_page,
+        render_key = get_display_page_key(curr_page, max_image_size, zoom)
+        if (not reset_cached and update_image_element and last_page_image
+                and last_page_image[0] == render_key):
+            return last_page_image[1]
+
+        page_image_data = document_pages.get_display_page(curr_page,
                                                     max_image_size=max_image_size,
                                                     zoom=zoom, reset_cached=reset_cached)
         if update_image_element:
+            set_image_element_data(*page_image_data)
+            last_page_image = (render_key, page_image_data)
+        return page_image_data
+
+    page_photo_image = None # The `PhotoImage` displayed by `image_element`.
+
+    def set_image_element_data(image_data, clip_pos, im_ht, im_wid):
+        """Display the PPM data `image_data` in `image_element`.  After the first
+        call the same Tk `PhotoImage` is reloaded in place, rather than having
+        `Image.Update` create a new one for every page."""
+        nonlocal page_photo_image
+        if page_photo_image is None:
             image_element.Update(data=image_data)
-        return image_data, clip_pos, im_ht, im_wid
+            page_photo_image = image_element.Widget.image
+            return
+        # Setting the size explicitly lets the photo shrink as well as grow.
+        page_photo_image.configure(width=im_wid, height=im_ht, data=image_data)
+        image_element.Widget.configure(width=im_wid, height=im_ht)
+
+    PREFETCH_PAGE_OFFSETS = (1, -1) # Pages, relative to current, to render when idle.
+    prefetch_pages = [] # Pages waiting to be rendered into the document's image cache.
+
+    def prefetch_page_images():
+        """Render one page from `prefetch_pages` into the image cache of
+        `document_pages` and reschedule itself if more are waiting.  This runs
+        as a tkinter idle callback on the main thread, since PyMuPDF documents
+        cannot be used safely from several threads."""
+        if not prefetch_pages or resize_thread_running:
+            prefetch_pages.clear()
+            return
+        page_num, max_image_size = prefetch_pages.pop(0)
+        if page_num < document_pages.num_pages: # Document may have been closed.
+            document_pages.get_display_page(page_num, max_image_size=max_image_size)
+        if prefetch_pages:
+            window.TKroot.after_idle(prefetch_page_images)
+
+    def schedule_page_prefetch(window):
+        """Queue the pages near `curr_page` to be rendered when the GUI is idle,
+        so that paging forward or back can use the cached images."""
+        was_empty = not prefetch_pages
+        prefetch_pages.clear()
+        max_image_size = get_max_image_size(window)
+        for offset in PREFETCH_PAGE_OFFSETS:
+            page_num = curr_page + offset
+            if 0 <= page_num < num_pages:
+                prefetch_pages.append((page_num, max_image_size))
+        if was_empty and prefetch_pages:
+            window.TKroot.after_idle(prefetch_page_images)
 
     def resize_window(window, document_pages, max_image_size, non_image_size,
                       im_wid=None, im_ht=None):
@@ -885,6 +977,19 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
     RESIZE_DELAY_SECS = 0.5 # Time to delay while user resizes window.
     resize_thread_running = False # Flag to only run one update thread.
     request_thread_exit = False # Flag used to kill thread on exit.
+    resize_lock = threading.Lock() # Guards `resize_thread_running` and `event_after_resize`.
+    event_after_resize = None # A Crop or Original event to resend after the resize thread.
+
+    def write_event_from_thread(event):
+        """Send `event` to the event loop from a thread, unless the window is being
+        closed.  The window can still close between the check and the call (which
+        then raises, since `window.Close` sets `TKroot` to `None`)."""
+        if request_thread_exit or window.TKrootDestroyed:
+            return
+        try:
+            window.write_event_value(event, None)
+        except (AttributeError, RuntimeError, tk.TclError):
+            pass
 
     def resize_page_on_configure_event(delay_secs=RESIZE_DELAY_SECS,
                                        max_image_size=None):
@@ -894,36 +999,113 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
         `resize_thread_running`).  Resize scaling is to make the image fit in
         the max window size, according to it's largest dimension (width or height)"""
         nonlocal resize_thread_running, old_window_size, user_selected_max_image_size
+        nonlocal event_after_resize
         resize_thread_running = True
 
-        # Wait for user to finish resizing.
-        time.sleep(delay_secs)
-        while window.size != old_window_size:
+        try:
+            # Wait for user to finish resizing.
+            time.sleep(delay_secs)
+            while window.size != old_window_size:
+                if request_thread_exit:
+                    return
+                old_window_size = window.size
+                time.sleep(delay_secs)
+
+            if max_image_size is None:
+                max_image_size = get_max_image_size(window)
+            # Note that if user_selected_max_image_size is passed in it gets reset to itself.
+            user_selected_max_image_size = max_image_size # Saved as a user preference.
+
             if request_thread_exit:
                 return
+            resize_window(window, document_pages, max_image_size, non_image_size)
+
+            if request_thread_exit:
+                return
+            # TODO: Is this update_page_image really necessary?  Should it come before
+            # or after resize of window?
+            image_data, clip_pos, im_ht, im_wid = update_page_image(window,
+                                                                    reset_cached=True,
+                                                                    zoom=zoom)
+
+            # Set the old window size and exit thread.
             old_window_size = window.size
-            time.sleep(delay_secs)
 
-        if max_image_size is None:
-            max_image_size = get_max_image_size(window)
-        # Note that if user_selected_max_image_size is passed in it gets reset to itself.
-        user_selected_max_image_size = max_image_size # Saved as a user preference.
+        finally:
+            # Resend any Crop or Original event that was put off while this ran.
+            with resize_lock:
+                resize_thread_running = False
+                deferred_event, event_after_resize = event_after_resize, None
+            if deferred_event:
+                write_event_from_thread(deferred_event)
 
-        if request_thread_exit:
-            return
-        resize_window(window, document_pages, max_image_size, non_image_size)
+    ##
+    ## Code for running the crop in a thread, so the GUI stays responsive.
+    ##
 
-        if request_thread_exit:
-            return
-        # TODO: Is this update_page_image really necessary?  Should it come before
-        # or after resize of window?
-        image_data, clip_pos, im_ht, im_wid = update_page_image(window,
-                                                                reset_cached=True,
-                                                                zoom=zoom)
+    button_crop = sg.Button("Crop")
+    button_original = sg.Button("Original")
+
+    crop_thread = None # The thread running `process_pdf_file`, while a crop runs.
+    crop_result = None # The (return_value, exception) of the last crop.
+
+    def crop_in_thread(bounding_box_list):
+        """Run `process_pdf_file` and save its return value, or the exception it
+        raised, in `crop_result`.  This is run as a thread.  Any exception
+        (including the `SystemExit` from `cleanup_and_exit`) is re-raised by the
+        main thread.  The event loop is woken with a `CROP_DONE_EVENT`."""
+        nonlocal crop_result
+        try:
+            crop_result = (process_pdf_file(input_doc_fname, fixed_input_doc_fname,
+                                            output_doc_fname, bounding_box_list), None)
+        except BaseException as e:
+            crop_result = (None, e)
+        write_event_from_thread(CROP_DONE_EVENT)
+
+    def get_crop_result():
+        """Wait for the crop thread to finish and return the value returned by
+        `process_pdf_file`, re-raising any exception it raised."""
+        nonlocal crop_thread
+        crop_thread.join()
+        crop_thread = None
+        return_value, exception = crop_result
+        if exception is not None:
+            raise exception
+        return return_value
 
-        # Set the old window size and exit thread.
-        old_window_size = window.size
-        resize_thread_running = False
+    ##
+    ## Code for skipping the update functions when no values have changed.
+    ##
+
+    last_updated_values = None # The option values last passed to the update functions.
+
+    def get_option_values(values_dict):
+        """Return a copy of `values_dict` without the page number, which changes on
+        every page navigation but is not an option value."""
+        option_values = dict(values_dict)
+        option_values.pop("PageNumber", None)
+        return option_values
+
+    def call_update_funs_if_values_changed(values_dict):
+        """Call all the functions in `update_funs` unless the option values in
+        `values_dict` are the same as on the last call.  Set `last_updated_values`
+        to `None` to force the next call, e.g. after the arguments are changed
+        outside the GUI values."""
+        nonlocal last_updated_values
+        if get_option_values(values_dict) == last_updated_values:
+            return
+        call_all_update_funs(update_funs, values_dict)
+        # Save the values that the elements show now, since update functions can
+        # reject a value and rewrite its field (e.g., a bad pages value is cleared).
+        # Otherwise entering the same rejected value again would not be checked.
+        last_updated_values = get_option_values(get_current_values(values_dict))
+
+    def get_current_values(values_dict):
+        """Return a copy of `values_dict` with the values currently shown by the
+        elements.  Only input elements are in `values_dict`, and their `Get`
+        methods return the same forms as `window.Read`."""
+        return {key: window.AllKeysDict[key].Get() if key in window.AllKeysDict else value
+                for key, value in values_dict.items()}
 
     ##
     ## Code for disabling options that are implied by others.
@@ -933,12 +1115,12 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
 
     def update_disabled_states(values_dict):
         """Disable widgets that are implied by other selected options."""
-        # Disable the uniform checkbox (this option implies uniform cropping).
-        # TODO: This should check when disabled then return to previous value, but that
-        # is currently not working so it just disables/enables in whatever state.
+        # Disable the uniform checkbox (this option implies uniform cropping).  The
+        # value before disabling is saved, and restored when it is re-enabled.
         if args.uniformOrderStat4 or values_dict["evenodd"]:
-            backing_uniform_checkbox_value[0] = values_dict["uniform"]
-            checkbox_uniform.Update(True, disabled=True) # Show that these options imply uniform.
+            if not checkbox_uniform.Disabled: # Nothing to do if already disabled.
+                backing_uniform_checkbox_value[0] = values_dict["uniform"]
+                checkbox_uniform.Update(True, disabled=True) # Show these options imply uniform.
         else:
             if checkbox_uniform.Disabled:
                 checkbox_uniform.Update(backing_uniform_checkbox_value[0], disabled=False)
@@ -949,6 +1131,13 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
     ## Setup and assign the window's layout.
     ##
 
+    def quad_row(element_list4, text_element):
+        """Return a layout row with the four elements in `element_list4` placed
+        like the left, bottom, right, and top margins, followed by the label
+        `text_element`."""
+        left, bottom, right, top = element_list4
+        return [left, sg.Column([[top], [bottom]], pad=(0,5)), right, text_element]
+
     layout = [ # The overall window layout.
         [
             sg.Button("Prev"),
@@ -957,7 +1146,7 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
             input_text_page_num,
             sg.Text(f"({num_pages})      "), # Show max page count.
             sg.Button("Toggle Zoom"),
-            sg.Text("(arrow keys navigate while zooming)"),
+            sg.Text(ZOOM_HELP_TEXT),
             #sg.Push(),
             #sg.Text("Quadruples are left, top, bottom, and right margins.\n"
             #                 "Mouse left over option names to show descriptions.",
@@ -983,9 +1172,8 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
                     # sg.Button("Toggle Zoom"),],
                     #[sg.Text("", size=(1,1))], # This is for vertical space.
 
-                    [sg.Text("Quadruples are left, top, bottom, and right margins.\n"
-                             "Mouse left over option names to show descriptions.",
-                             relief=sg.RELIEF_GROOVE, pad=(None, (0,5)))], # Extra pad on bottom.
+                    [sg.Text(QUADRUPLES_HELP_TEXT, relief=sg.RELIEF_GROOVE,
+                             pad=(None, (0,5)))], # Extra pad on bottom.
 
                     [checkbox_uniform, checkbox_samePageSize, checkbox_evenodd],
 
@@ -995,10 +1183,7 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
                         input_text_percentRetain, text_percentRetain, checkbox_percentText],
 
                     # percentRetain4
-                    [input_text_percentRetain4[0],
-                        sg.Column([[input_text_percentRetain4[3]],
-                                   [input_text_percentRetain4[1]]], pad=(0,5)),
-                        input_text_percentRetain4[2]] + [text_percentRetain4],
+                    quad_row(input_text_percentRetain4, text_percentRetain4),
 
                     # absoluteOffset
                     [sg.Text("", size=input_text_absoluteOffset.Size,
@@ -1006,19 +1191,13 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
                         input_text_absoluteOffset, text_absoluteOffset, checkbox_cropSafe],
 
                     # absoluteOffset4
-                    [input_text_absoluteOffset4[0],
-                        sg.Column([[input_text_absoluteOffset4[3]],
-                                   [input_text_absoluteOffset4[1]]], pad=(0,5)),
-                        input_text_absoluteOffset4[2]] + [text_absoluteOffset4],
+                    quad_row(input_text_absoluteOffset4, text_absoluteOffset4),
 
                     # uniformOrderStat
                     [dummy_spacing_spinner, input_text_uniformOrderStat, text_uniformOrderStat],
 
                     # uniformOrderStat4
-                    [input_text_uniformOrderStat4[0],
-                        sg.Column([[input_text_uniformOrderStat4[3]],
-                                   [input_text_uniformOrderStat4[1]]], pad=(0,5)),
-                        input_text_uniformOrderStat4[2]] + [text_uniformOrderStat4],
+                    quad_row(input_text_uniformOrderStat4, text_uniformOrderStat4),
 
                     # setPageRatios
                     [sg.Text("", size=input_text_uniformOrderStat.Size,
@@ -1026,10 +1205,7 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
                         input_text_setPageRatios, text_setPageRatios],
 
                     # pageRatioWeights
-                    [input_text_pageRatioWeights[0],
-                        sg.Column([[input_text_pageRatioWeights[3]],
-                                   [input_text_pageRatioWeights[1]]], pad=(0,5)),
-                        input_text_pageRatioWeights[2]] + [text_pageRatioWeights],
+                    quad_row(input_text_pageRatioWeights, text_pageRatioWeights),
 
                     # absolutePreCrop
                     [sg.Text("", size=input_text_absolutePreCrop.Size,
@@ -1037,10 +1213,7 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
                         input_text_absolutePreCrop, text_absolutePreCrop],
 
                     # absolutePreCrop4
-                    [input_text_absolutePreCrop4[0],
-                        sg.Column([[input_text_absolutePreCrop4[3]],
-                                   [input_text_absolutePreCrop4[1]]], pad=(0,5)),
-                        input_text_absolutePreCrop4[2]] + [text_absolutePreCrop4],
+                    quad_row(input_text_absolutePreCrop4, text_absolutePreCrop4),
 
                     # threshold, numBlurs, numSmooths
                     [input_num_threshold, text_threshold, input_num_numBlurs,
@@ -1050,7 +1223,7 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
                     [input_text_pages, text_pages, combo_box_restore, text_restore],
 
                     # buttons
-                    [sg.Button("Crop"), sg.Button("Original"), sg.Button("Exit"),],
+                    [button_crop, button_original, sg.Button("Exit"),],
                     #[sg.Text("", size=(1,1))], # This is for vertical space.
                     [smallest_delta_label_text],
                     smallest_delta_values_display,
@@ -1158,10 +1331,8 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
     did_crop = False
     bounding_box_list = None
 
-    last_pre_crop = None
-    last_threshold = None
-    last_numSmooths = None
-    last_numBlurs = None
+    bounding_box_cache = OrderedDict() # LRU cache of bounding box lists, keyed by their args.
+    bounding_box_args = None # The args of the bounding boxes for the current crop.
 
     old_window_size = window.size
 
@@ -1176,70 +1347,80 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
         if event is None and (values_dict is None or values_dict["PageNumber"] is None):
             break
 
-        if event == sg.WIN_CLOSED or Events.is_exit(event):
-            if resize_thread_running:
-                request_thread_exit = True
+        event_kind = get_event_kind(event)
+
+        if event == sg.WIN_CLOSED or event_kind == "exit":
             break
 
-        if Events.is_enter(event):
+        if crop_thread and event_kind != "crop_done":
+            continue # The document is closed while cropping, so ignore other events.
+
+        if event_kind == "crop" or event_kind == "original":
+            # These close the document, which a resize thread may still be rendering
+            # from (PyMuPDF is not thread-safe).  If so, the thread resends the event
+            # when it finishes.
+            with resize_lock:
+                defer_event = resize_thread_running
+                if defer_event:
+                    event_after_resize = event
+            if defer_event:
+                continue
+
+        if event_kind == "enter":
             # This is for when a page number is manually entered in the window.
-            call_all_update_funs(update_funs, values_dict)
-            try:
-                curr_page = int(values_dict["PageNumber"]) - 1  # check if valid
-            except: # TODO: Use explicit exceptions,
-                curr_page = prev_curr_page
+            call_update_funs_if_values_changed(values_dict)
+            curr_page = get_entered_page(values_dict, prev_curr_page)
             page_change_event = True
 
-        if Events.is_page_num_change(event):
-            call_all_update_funs(update_funs, values_dict)
-            try:
-                curr_page = int(values_dict["PageNumber"]) - 1  # check if valid
-            except: # TODO: use explicit exceptions.
-                curr_page = prev_curr_page
+        if event_kind == "page_num_change":
+            call_update_funs_if_values_changed(values_dict)
+            curr_page = get_entered_page(values_dict, prev_curr_page)
             page_change_event = True
 
-        elif Events.is_next(event):
+        elif event_kind == "next":
             curr_page += 1
             page_change_event = True
 
-        elif Events.is_prev(event):
+        elif event_kind == "prev":
             curr_page -= 1
             page_change_event = True
 
-        elif Events.is_up(event) and zoom:
+        elif event_kind == "up" and zoom:
             zoom = (clip_pos, 0, -1)
             update_page_image_event = True
 
-        elif Events.is_down(event) and zoom:
+        elif event_kind == "down" and zoom:
             zoom = (clip_pos, 0, 1)
             update_page_image_event = True
 
-        elif Events.is_home(event):
+        elif event_kind == "home":
             curr_page = 0
             page_change_event = True
 
-        elif Events.is_end(event):
+        elif event_kind == "end":
             curr_page = num_pages - 1
             page_change_event = True
 
-        elif Events.is_left(event) and zoom:
+        elif event_kind == "left" and zoom:
             zoom = (clip_pos, -1, 0)
             update_page_image_event = True
 
-        elif Events.is_right(event) and zoom:
+        elif event_kind == "right" and zoom:
             zoom = (clip_pos, 1, 0)
             update_page_image_event = True
 
-        elif Events.is_zoom(event): # Toggle.
+        elif event_kind == "zoom": # Toggle.
             if not zoom:
                 zoom = (clip_pos, 0, 0)
             else:
                 zoom = False
             update_page_image_event = True
 
-        elif Events.is_crop(event):
-            call_all_update_funs(update_funs, values_dict)
+        elif event_kind == "crop":
+            call_update_funs_if_values_changed(values_dict)
+            prefetch_pages.clear()
             document_pages.close_document()
+            shrink_mupdf_store() # Free the resources MuPDF cached for the closed document.
 
             # Display the wait message as a popup (unused alternative).
             #nonblock_popup = sg.PopupNoWait(
@@ -1259,30 +1440,30 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
             #        no_titlebar=True,
             #        grab_anywhere=True,
             #        location=(100,100))
+
+            # Display the wait message and disable the buttons until the crop is done.
             wait_indicator_text.Update(visible=True)
-            window.Refresh()
-
-            # If the pre-crop values changed then bounding boxes must be redone.
-            all_pre_crop = args.absolutePreCrop + args.absolutePreCrop4
-            if last_pre_crop != all_pre_crop:
-                bounding_box_list = None # Kill saved bounding boxes.
-                last_pre_crop = all_pre_crop
-            # New thresholding params also require recalculation of bounding boxes.
-            if last_threshold != args.threshold[0]:
-                bounding_box_list = None
-                last_threshold = args.threshold[0]
-            if last_numBlurs != args.numBlurs:
-                bounding_box_list = None
-                last_numBlurs = args.numBlurs
-            if last_numSmooths != args.numSmooths:
-                bounding_box_list = None
-                last_numSmooths = args.numSmooths
-
-            # Do the crop, saving the bounding box list.
-            bounding_box_list, delta_page_nums = process_pdf_file(input_doc_fname,
-                                                                  fixed_input_doc_fname,
-                                                                  output_doc_fname,
-                                                                  bounding_box_list)
+            button_crop.Update(disabled=True)
+            button_original.Update(disabled=True)
+
+            # The bounding boxes only depend on the pre-crop values and thresholding
+            # params, so reuse any saved bounding boxes calculated with the same values.
+            bounding_box_args = (tuple(args.absolutePreCrop + args.absolutePreCrop4),
+                                 args.threshold[0], args.numBlurs, args.numSmooths)
+            bounding_box_list = bounding_box_cache.get(bounding_box_args)
+
+            # Do the crop in a thread, saving the bounding box list when it is done.
+            crop_thread = threading.Thread(target=crop_in_thread, args=(bounding_box_list,))
+            crop_thread.daemon = True
+            crop_thread.start()
+
+        elif event_kind == "crop_done":
+            bounding_box_list, delta_page_nums = get_crop_result()
+            if bounding_box_list:
+                bounding_box_cache[bounding_box_args] = bounding_box_list
+                bounding_box_cache.move_to_end(bounding_box_args)
+                if len(bounding_box_cache) > BOUNDING_BOX_CACHE_SIZE:
+                    bounding_box_cache.popitem(last=False)
 
             update_smallest_delta_values_display(delta_page_nums, disabled=args.restore)
 
@@ -1296,8 +1477,17 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
 
             # Change the view to the new cropped file.
             num_pages = document_pages.open_document(output_doc_fname)
+            last_page_image = None # Force a redraw from the new document.
             did_crop = True
             wait_indicator_text.Update(visible=False)
+            button_crop.Update(disabled=False)
+            button_original.Update(disabled=False)
+
+            # Apply any option edits made during the crop.  The crop can change the
+            # args (e.g., restore), so the update functions are run with the values
+            # currently shown rather than the ones read with this event.
+            last_updated_values = None
+            call_update_funs_if_values_changed(get_current_values(values_dict))
 
             update_page_image_event = True
             resize_window_event = True
@@ -1305,63 +1495,62 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
             if parsed_args.verbose:
                 print("\nWaiting for the GUI...")
 
-        elif Events.is_original(event):
-            call_all_update_funs(update_funs, values_dict)
+        elif event_kind == "original":
+            call_update_funs_if_values_changed(values_dict)
+            prefetch_pages.clear()
             document_pages.close_document()
+            shrink_mupdf_store() # Free the resources MuPDF cached for the closed document.
             num_pages = document_pages.open_document(fixed_input_doc_fname)
+            last_page_image = None # Force a redraw from the new document.
             did_crop = False
             set_delta_values_null()
+            last_updated_values = None
             update_page_image_event = True
             resize_window_event = True
 
-        elif Events.is_left_smallest_delta(event):
+        elif event_kind == "left_smallest_delta":
             curr_page, left_smallest_toggle = get_page_from_delta_page_nums(
                                                               delta_page_nums,
                                                               left_smallest_toggle, 0)
             page_change_event = True
 
-        elif Events.is_top_smallest_delta(event):
+        elif event_kind == "top_smallest_delta":
             curr_page, top_smallest_toggle = get_page_from_delta_page_nums(
                                                               delta_page_nums,
                                                               top_smallest_toggle, 3)
             page_change_event = True
 
-        elif Events.is_bottom_smallest_delta(event):
+        elif event_kind == "bottom_smallest_delta":
             curr_page, bottom_smallest_toggle = get_page_from_delta_page_nums(
                                                               delta_page_nums,
                                                               bottom_smallest_toggle, 1)
             page_change_event = True
 
-        elif Events.is_right_smallest_delta(event):
+        elif event_kind == "right_smallest_delta":
             curr_page, right_smallest_toggle = get_page_from_delta_page_nums(
                                                               delta_page_nums,
                                                               right_smallest_toggle, 2)
             page_change_event = True
 
-        elif Events.is_paired_single_and_quadruple_change(event):
-            call_all_update_funs(update_funs, values_dict)
-
-        elif Events.is_evenodd(event):
-            call_all_update_funs(update_funs, values_dict)
+        elif event_kind in VALUE_CHANGE_EVENT_KINDS:
+            # The general checkbox clicks were added to try to make things more responsive
+            # on Windows, where multiple checkbox clicks become unresponsive until something
+            # else is clicked or return is entered in a box.  Doesn't help much.
+            call_update_funs_if_values_changed(values_dict)
 
-        elif Events.is_general_checkbox_click(event):
-            # This was added to try to make things more responsive on Windows, where multiple
-            # checkbox clicks become unresponsive until something else is clicked or return
-            # is entered in a box.  Doesn't help much.
-            call_all_update_funs(update_funs, values_dict)
-
-        elif Events.is_configure(event): # Capture tkinter window resizes.
+        elif event_kind == "configure": # Capture tkinter window resizes.
             if window.size != old_window_size and not resize_thread_running:
                 # Note possible threading bug, calling pysimplegui from a thread:
                 # https://github.com/PySimpleGUI/PySimpleGUI/issues/4051
                 request_thread_exit = False
+                resize_thread_running = True # Set before the thread starts running.
                 proc = threading.Thread(target=resize_page_on_configure_event)
                 proc.daemon = True
                 proc.start()
 
         if page_change_event:
-            curr_page = update_page_number(curr_page, prev_curr_page, num_pages, event,
-                                      values_dict["PageNumber"], input_text_page_num)
+            curr_page = update_page_number(curr_page, num_pages, values_dict["PageNumber"],
+                                           input_text_page_num)
 
         # Resize the main GUI window if such an event was triggered.
         if resize_window_event:
@@ -1370,13 +1559,21 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
 
         # Get the current page and display it.
         if update_page_image_event or page_change_event:
-            reset_cached = Events.is_crop(event)
+            reset_cached = event_kind == "crop_done"
             image_data, clip_pos, im_ht, im_wid = update_page_image(window,
                                                                     reset_cached=reset_cached,
                                                                     zoom=zoom)
+            if page_change_event and not zoom:
+                schedule_page_prefetch(window)
 
+    request_thread_exit = True # Stop any running threads from using the window.
     window.Close()
-    document_pages.close_document() # Be sure document is closed (bug with -mo without this).
+    if crop_thread: # The window was closed during a crop, so let the crop finish.
+        bounding_box_list, delta_page_nums = get_crop_result()
+        did_crop = True
+    else:
+        document_pages.close_document() # Be sure document is closed (bug with -mo without this).
+        shrink_mupdf_store()
     return did_crop, bounding_box_list, delta_page_nums
 
 #
@@ -1386,17 +1583,23 @@ def create_gui(input_doc_fname, fixed_input_doc_fname, output_doc_fname,
 wrapper = textwrap.TextWrapper(initial_indent="", subsequent_indent="", width=45,
                                break_on_hyphens=False)
 
+@functools.lru_cache(maxsize=None)
+def get_parser_option_string_index(cmd_parser):
+    """Return a dict mapping each option string of the argparse parser
+    `cmd_parser` to its action, built in one pass over the actions."""
+    return {option_string: a for a in cmd_parser._actions
+                              for option_string in a.option_strings}
+
+@functools.lru_cache(maxsize=None)
 def get_help_text_string_for_tooltip(cmd_parser, option_string):
     """Extract the help message for an option from an argparse command parser.
-    This gets the argparse help string to use as a tooltip."""
-    for a in cmd_parser._actions:
-        if "--" + option_string in a.option_strings:
-            help_text = a.help
-            option_list = a.option_strings
-            break
-    else:
+    This gets the argparse help string to use as a tooltip.  The formatted
+    strings are cached (argparse parsers hash by identity)."""
+    action = get_parser_option_string_index(cmd_parser).get("--" + option_string)
+    if action is None:
         return None
-    help_text = textwrap.dedent(help_text)
+    option_list = action.option_strings
+    help_text = textwrap.dedent(action.help)
     formatted_para = wrapper.fill(help_text)
     combined_para = " ".join(option_list) + "\n\n" + formatted_para
     combined_para = combined_para.replace("^^n", "\n")
@@ -41,6 +41,7 @@ https://github.com/PySimpleGUI/PySimpleGUI/blob/master/DemoPrograms/Demo_PDF_Vie
 
 import sys
 import warnings
+from collections import OrderedDict
 from . import external_program_calls as ex
 
 has_mupdf = True
@@ -67,6 +68,15 @@ RESTORE_METADATA_KEY = "pdfCropMarginsRestoreData" # Key for XML dict restore da
 # Limit precision to some reasonable amount to prevent problems in some PDF viewers.
 DECIMAL_PRECISION_FOR_MARGIN_POINT_VALUES = 8
 
+# The maximum number of page display lists to keep for rendering pages in the GUI.
+PAGE_DISPLAY_LIST_CACHE_SIZE = 32
+
+# The maximum total size (in bytes) of rendered page images to keep for redisplay
+# in the GUI.  The images are uncompressed PPM data, three bytes per pixel, so a
+# page filling a 1000x1300 pixel preview area is about 4 MB.  This holds around
+# six such images: the current page, its prefetched neighbors, and a few others.
+PAGE_IMAGE_CACHE_BYTES = 24 * 2**20
+
 #
 # Utility functions.
 #
@@ -211,6 +221,19 @@ def print_page_boxes(page):
         print(f" ArtBox: {page.artbox}")
     print() # Add a newline for readability
 
+def shrink_mupdf_store():
+    """Empty MuPDF's resource store, which otherwise keeps fonts and images from
+    closed documents.  The store is shared by the whole process, so only call
+    this when no other document is being used."""
+    fitz.TOOLS.store_shrink(100)
+
+def get_display_page_key(page_num, max_image_size, zoom):
+    """Return a hashable key for the image that `MuPdfDocument.get_display_page`
+    returns for these arguments.  The zoom clip position (a `fitz.Point`) is
+    converted to a tuple so that the key is hashable."""
+    zoom_key = (tuple(zoom[0]), zoom[1], zoom[2]) if zoom else False
+    return (page_num, tuple(max_image_size), zoom_key)
+
 #
 # The main class.
 #
@@ -231,8 +254,12 @@ class MuPdfDocument:
     def clear_cache(self):
         """Clear the cache of rendered document pages."""
         self.num_pages = 0
-        self.page_display_list_cache = []
-        self.page_crop_display_list_cache = []
+        self.page_display_list_cache = OrderedDict() # LRU cache of displayed pages.
+        self.page_crop_display_list_cache = {}
+        self.page_image_cache = OrderedDict() # LRU cache of `get_display_page` results.
+        self.page_image_cache_bytes = 0
+        self.max_width_and_height = None
+        self.display_matrix_cache = {} # Maps `max_image_size` to (nozoom_mat, zoom_mat).
 
     def open_document(self, doc_fname):
         """Open the document with fitz (PyMuPDF) and return the number of pages."""
@@ -275,8 +302,12 @@ class MuPdfDocument:
         self.page_list = [page for page in self.document]
         self.num_pages = len(self.document)
 
-        self.page_display_list_cache = [None] * self.num_pages
-        self.page_crop_display_list_cache = [None] * self.num_pages
+        self.page_display_list_cache = OrderedDict()
+        self.page_crop_display_list_cache = {}
+        self.page_image_cache = OrderedDict()
+        self.page_image_cache_bytes = 0
+        self.max_width_and_height = None
+        self.display_matrix_cache = {}
         return self.num_pages
 
     def get_page_sizes(self):
@@ -306,7 +337,10 @@ class MuPdfDocument:
 
     def get_max_width_and_height(self):
         """Return the maximum width and height (in points) of PDF pages in the
-        document."""
+        document.  The value is saved, since the GUI asks for it on every
+        render; it is reset when a document is opened."""
+        if self.max_width_and_height:
+            return self.max_width_and_height
         max_wid = -1
         max_ht = -1
         for page in self.document:
@@ -314,8 +348,30 @@ class MuPdfDocument:
                 max_wid = page.rect.width
             if page.rect.height > max_ht:
                 max_ht = page.rect.height
+        self.max_width_and_height = max_wid, max_ht
         return max_wid, max_ht
 
+    def get_display_matrices(self, max_image_size):
+        """Return the tuple `(nozoom_mat, zoom_mat)` of transformation matrices
+        which scale every page of the document to fit within `max_image_size`,
+        unzoomed and zoomed.  These depend only on the image size and the
+        document, so they are saved per size."""
+        max_image_size = tuple(max_image_size)
+        matrices = self.display_matrix_cache.get(max_image_size)
+        if matrices:
+            return matrices
+
+        # Make sure that all the images across the document will fit the screen.
+        max_wid, max_ht = self.get_max_width_and_height()
+
+        nozoom_scale = min(max_image_size[0]/max_wid,
+                           max_image_size[1]/max_ht)
+        nozoom_mat = fitz.Matrix(nozoom_scale, nozoom_scale)
+        zoom_mat = fitz.Matrix(2 * nozoom_scale, 2 * nozoom_scale) # Zoom is 2x scale.
+        matrices = nozoom_mat, zoom_mat
+        self.display_matrix_cache[max_image_size] = matrices
+        return matrices
+
     def get_box_list(self, boxstring):
         """Get a list of all the boxes of the type `boxstring`, e.g. `"artbox"`
         or `"mediabox"`."""
@@ -355,11 +411,10 @@ class MuPdfDocument:
         colorspace = fitz.csGRAY # or fitz.csRGB, or see above.
 
         if cache:
-            page_crop_display_list = self.page_crop_display_list_cache[page_num]
+            page_crop_display_list = self.page_crop_display_list_cache.get(page_num)
             if not page_crop_display_list:  # Create if not yet there.
-                self.page_crop_display_list_cache[page_num] = self.document[
-                                                              page_num].get_displaylist()
-                page_crop_display_list = self.page_crop_display_list_cache[page_num]
+                page_crop_display_list = self.document[page_num].get_displaylist()
+                self.page_crop_display_list_cache[page_num] = page_crop_display_list
         else:
             page_crop_display_list = self.document[page_num].get_displaylist()
 
@@ -389,57 +444,65 @@ class MuPdfDocument:
 
     def get_display_page(self, page_num, max_image_size, zoom=False,
                          reset_cached=False):
-        """Return a `tkinter.PhotoImage` or a PNG image for a document page
+        """Return PPM image data (for a `tkinter.PhotoImage`) for a document page
         number.  The `page_num` argument is a 0-based page number.  The
         `zoom` argument is the top-left of old clip rect, and one of -1, 0,
         +1 for dim. x or y to indicate the arrow key pressed.  The
         `max_image_size` argument is the (width, height) of available image
-        area."""
-        if not reset_cached:
-            page_display_list = self.page_display_list_cache[page_num]
-        else:
-            page_display_list = None
-
-        if not page_display_list:  # Create if not yet there.
-            self.page_display_list_cache[page_num] = self.document[page_num].get_displaylist()
+        area.  Recently rendered images are cached and returned again when
+        the same page, size, and zoom are requested (unless `reset_cached` is
+        true)."""
+        image_cache_key = get_display_page_key(page_num, max_image_size, zoom)
+        if not reset_cached and image_cache_key in self.page_image_cache:
+            self.page_image_cache.move_to_end(image_cache_key)
+            return self.page_image_cache[image_cache_key]
+
+        if not reset_cached and page_num in self.page_display_list_cache:
             page_display_list = self.page_display_list_cache[page_num]
+            self.page_display_list_cache.move_to_end(page_num)
+        else:  # Create if not yet there.
+            page_display_list = self.document[page_num].get_displaylist()
+            self.page_display_list_cache[page_num] = page_display_list
+            if len(self.page_display_list_cache) > PAGE_DISPLAY_LIST_CACHE_SIZE:
+                self.page_display_list_cache.popitem(last=False) # Remove least-recently used.
 
         page_rect = page_display_list.rect  # The page rectangle.
-        clip = page_rect
-
-        # Make sure that all the images across the document will fit the screen.
-        max_wid, max_ht = self.get_max_width_and_height()
-
-        nozoom_scale = min(max_image_size[0]/max_wid,
-                           max_image_size[1]/max_ht)
-        nozoom_mat = fitz.Matrix(nozoom_scale, nozoom_scale)
+        nozoom_mat, zoom_mat = self.get_display_matrices(max_image_size)
 
         if zoom:
+            # The clip rect is a quarter page.  Move its top-left according to the
+            # arrow key provided, but stay within the page rect.
             width2 = page_rect.width / 2
             height2 = page_rect.height / 2
-
-            clip = page_rect * 0.5     # Clip rect size is a quarter page.
-            top_left = zoom[0]
-            top_left.x += zoom[1] * (width2 / 2)     # adjust top-left ...
-            top_left.x = max(0, top_left.x)          # according to ...
-            top_left.x = min(width2, top_left.x)     # arrow key ...
-            top_left.y += zoom[2] * (height2 / 2)    # provided, but ...
-            top_left.y = max(0, top_left.y)          # stay within ...
-            top_left.y = min(height2, top_left.y)    # the page rect
-            clip = fitz.Rect(top_left, top_left.x + width2, top_left.y + height2)
+            x, y = zoom[0]
+            x = min(max(x + zoom[1] * (width2 / 2), 0), width2)
+            y = min(max(y + zoom[2] * (height2 / 2), 0), height2)
+            clip = (x, y, x + width2, y + height2)
 
             # Clip rect is ready, now fill it.
-            zoom_mat = nozoom_mat * fitz.Matrix(2, 2)  # The zoom matrix.
             pixmap = page_display_list.get_pixmap(alpha=False, matrix=zoom_mat, clip=clip)
+            image_tl = fitz.Point(x, y) # Clip position (top left).
 
         else:  # Show the total page.
             pixmap = page_display_list.get_pixmap(matrix=nozoom_mat, alpha=False)
+            image_tl = page_rect.tl
 
-        #image_png = pixmap.tobytes()  # get the PNG image
         image_height, image_width = pixmap.height, pixmap.width
-        image_ppm = pixmap.tobytes("png")  # Make PPM image from pixmap for tkinter.
-        image_tl = clip.tl # Clip position (top left).
-        return image_ppm, image_tl, image_height, image_width
+        # Make PPM image for tkinter by prepending a header to the raw RGB samples,
+        # which is much faster than having MuPDF encode a PNG or PPM.
+        image_ppm = b"P6\n%d %d\n255\n" % (image_width, image_height) + pixmap.samples
+
+        display_page = (image_ppm, image_tl, image_height, image_width)
+        old_display_page = self.page_image_cache.pop(image_cache_key, None)
+        if old_display_page:
+            self.page_image_cache_bytes -= len(old_display_page[0])
+        self.page_image_cache[image_cache_key] = display_page
+        self.page_image_cache_bytes += len(image_ppm)
+        while (self.page_image_cache_bytes > PAGE_IMAGE_CACHE_BYTES
+                   and len(self.page_image_cache) > 1):
+            # Remove least-recently used.
+            self.page_image_cache_bytes -= len(self.page_image_cache.popitem(last=False)[1][0])
+        return display_page
 
     def get_full_page_box_list_assigning_media_and_crop(self, quiet=False):
         """Get a list of all the full-page box values for each page.  The boxes on